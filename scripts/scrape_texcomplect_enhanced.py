@@ -6,12 +6,12 @@
 БЕЗ парсинга картинок.
 """
 
-import os
 import re
 import time
 import hashlib
 from urllib.parse import urljoin, urlparse, urlunparse, urlencode, parse_qsl
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from typing import List, Dict, Optional
 
 import requests
@@ -20,7 +20,7 @@ from sqlalchemy.orm import Session
 
 # Импорт моделей базы данных
 import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 from app.db.database import SessionLocal
 from app.db.models.product import Product
 from app.db.models.category import Category
@@ -4,8 +4,10 @@
 """
 
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(_ROOT))
 
 from app.services.storage_service import MinIOStorageProvider
 from io import BytesIO